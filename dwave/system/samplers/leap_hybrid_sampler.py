@@ -17,9 +17,14 @@
 A :std:doc:`dimod sampler <oceandocs:docs_dimod/reference/samplers>` for Leap's hybrid solvers.
 """
 from __future__ import division
-import numpy as np
+import asyncio
+import bisect
+import concurrent.futures
+import functools
+import itertools
 from warnings import warn
 from numbers import Number
+from types import MappingProxyType
 from collections import abc
 
 import dimod
@@ -29,6 +34,44 @@ from dwave.cloud import Client
 
 __all__ = ['LeapHybridSampler', 'LeapHybridDQMSampler']
 
+# BQM types that can be serialized by FileView
+_FILEVIEW_BQM_TYPES = (dimod.AdjArrayBQM, dimod.AdjMapBQM, dimod.AdjVectorBQM)
+
+
+def _interp(x, xp, fp):
+    """Scalar equivalent of :func:`numpy.interp` for sequences `xp` and `fp`.
+
+    Values of `x` outside of `xp` are clamped to the first or last value of
+    `fp`.
+    """
+    i = bisect.bisect_right(xp, x)
+    if i == 0:
+        return fp[0]
+    if i == len(xp):
+        return fp[-1]
+    return fp[i-1] + (x - xp[i-1]) * (fp[i] - fp[i-1]) / (xp[i] - xp[i-1])
+
+
+def _pivots(curve):
+    """Unzip a piecewise-linear curve given as ``[[x, y], ...]`` pairs into
+    the `xp` and `fp` sequences of floats used by :func:`_interp`.
+    """
+    xx, yy = zip(*curve)
+    return tuple(map(float, xx)), tuple(map(float, yy))
+
+
+def _sample_resolved(sample, *args, **kwargs):
+    """Call the given sample method and wait for the sample set to resolve."""
+    sampleset = sample(*args, **kwargs)
+    sampleset.resolve()
+    return sampleset
+
+
+def _is_range(variables):
+    """Return True if the variables are labelled 0, 1, ..., n-1 in order."""
+    # compare the type as well so that e.g. 1.0 or True are not treated as 1
+    return all(v.__class__ is int and v == i for i, v in enumerate(variables))
+
 
 class LeapHybridSampler(dimod.Sampler):
     """A class for using Leap's cloud-based hybrid BQM solvers.
@@ -44,6 +87,11 @@ class LeapHybridSampler(dimod.Sampler):
     Inherits from :class:`dimod.Sampler`.
 
     Args:
+        connection_close (bool, optional, default=False):
+            Force HTTP connections to the solver API to be closed after each
+            request. By default, connections are kept alive and reused across
+            the upload, submit and poll requests of successive samples.
+
         **config:
             Keyword arguments passed to :meth:`dwave.cloud.client.Client.from_config`.
 
@@ -71,7 +119,7 @@ class LeapHybridSampler(dimod.Sampler):
 
     _INTEGER_BQM_SIZE_THRESHOLD = 10000
 
-    def __init__(self, solver=None, connection_close=True, **config):
+    def __init__(self, solver=None, connection_close=False, **config):
 
         # we want a Hybrid solver by default, but allow override
         config.setdefault('client', 'hybrid')
@@ -102,15 +150,20 @@ class LeapHybridSampler(dimod.Sampler):
 
     @property
     def properties(self):
-        """dict: Solver properties as returned by a SAPI query.
+        """Mapping: Solver properties as returned by a SAPI query.
 
         `Solver properties <https://docs.dwavesys.com/docs/latest/c_solver_3.html>`_
         are dependent on the selected solver and subject to change.
+
+        The properties are a read-only view of the solver's properties. The
+        view cannot be serialized directly (e.g., with :func:`json.dumps`,
+        :func:`copy.deepcopy` or :mod:`pickle`); use ``dict(properties)`` to
+        get a copy.
         """
         try:
             return self._properties
         except AttributeError:
-            self._properties = properties = self.solver.properties.copy()
+            self._properties = properties = MappingProxyType(self.solver.properties)
             return properties
 
     @property
@@ -174,14 +227,15 @@ class LeapHybridSampler(dimod.Sampler):
         """
 
         num_vars = bqm.num_variables
+        min_time_limit = self.min_time_limit(bqm)
 
         if time_limit is None:
-            time_limit = self.min_time_limit(bqm)
+            time_limit = min_time_limit
         if not isinstance(time_limit, Number):
             raise TypeError("time limit must be a number")
-        if time_limit < self.min_time_limit(bqm):
+        if time_limit < min_time_limit:
             msg = ("time limit for problem size {} must be at least {}"
-                   ).format(num_vars, self.min_time_limit(bqm))
+                   ).format(num_vars, min_time_limit)
             raise ValueError(msg)
 
         # for very large BQMs, it is better to send the unlabelled version,
@@ -193,15 +247,168 @@ class LeapHybridSampler(dimod.Sampler):
 
         return self._sample(bqm, time_limit=time_limit, **kwargs)
 
+    async def sample_async(self, bqm, time_limit=None, **kwargs):
+        """Sample from the specified binary quadratic model asynchronously.
+
+        Coroutine version of :meth:`~dwave.system.samplers.LeapHybridSampler.sample`.
+        Uploading the problem and waiting on the solver are done in the event
+        loop's default executor, so several problems can be in flight at once
+        and the returned sample set is already resolved.
+        Accepts the same arguments as
+        :meth:`~dwave.system.samplers.LeapHybridSampler.sample`.
+
+        Returns:
+            :class:`dimod.SampleSet`: A `dimod` :obj:`~dimod.SampleSet` object.
+
+        Examples:
+            This example submits two problems concurrently.
+
+            >>> import asyncio
+            >>> import dimod
+            ...
+            >>> bqm0 = dimod.BQM.from_qubo({('a', 'b'): -1})
+            >>> bqm1 = dimod.BQM.from_ising({}, {('a', 'b'): 1})
+            >>> sampler = LeapHybridSampler()    # doctest: +SKIP
+            >>> async def sample_both():
+            ...     return await asyncio.gather(sampler.sample_async(bqm0),
+            ...                                 sampler.sample_async(bqm1))
+            >>> loop = asyncio.get_event_loop()
+            >>> sampleset0, sampleset1 = loop.run_until_complete(sample_both())   # doctest: +SKIP
+
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(_sample_resolved, self.sample, bqm,
+                                    time_limit=time_limit, **kwargs))
+
+    def sample_many(self, bqms, *, max_in_flight=4, **kwargs):
+        """Sample from each of the specified binary quadratic models.
+
+        Up to `max_in_flight` problems are uploaded and solved concurrently,
+        so the serialization and upload of one problem overlaps with the
+        solving of the others.
+
+        Args:
+            bqms (iterable[:obj:`dimod.BinaryQuadraticModel`]):
+                Binary quadratic models.
+
+            max_in_flight (int, optional, default=4):
+                Maximum number of problems submitted to the solver at any
+                one time.
+
+            **kwargs:
+                Optional keyword arguments for
+                :meth:`~dwave.system.samplers.LeapHybridSampler.sample`, applied
+                to every problem.
+
+        Returns:
+            list[:class:`dimod.SampleSet`]: A sample set for each binary
+            quadratic model, in the order given.
+
+        Examples:
+            This example samples from a sweep over the coupling strength of
+            a small QUBO.
+
+            >>> import dimod
+            ...
+            >>> bqms = [dimod.BQM.from_qubo({('a', 'b'): j}) for j in (-1, 0, 1)]
+            >>> sampler = LeapHybridSampler()    # doctest: +SKIP
+            >>> samplesets = sampler.sample_many(bqms)   # doctest: +SKIP
+
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        # wait for the solver in each worker so that max_in_flight bounds the
+        # problems in the queue, not just the uploads
+        sample = functools.partial(_sample_resolved, self.sample, **kwargs)
+
+        # submit lazily rather than with executor.map, which would queue every
+        # problem up front and keep solving them after an error
+        bqms = iter(bqms)
+        futures = []
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_in_flight)
+        try:
+            pending = set()
+            for bqm in itertools.islice(bqms, max_in_flight):
+                futures.append(executor.submit(sample, bqm))
+                pending.add(futures[-1])
+
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                for future in done:
+                    future.result()  # raise the first error, if any
+
+                for bqm in itertools.islice(bqms, len(done)):
+                    futures.append(executor.submit(sample, bqm))
+                    pending.add(futures[-1])
+        except BaseException:
+            # don't wait on the problems already in flight, and make sure no
+            # more are started
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            raise
+
+        executor.shutdown()
+        return [future.result() for future in futures]
+
+    def sample_ising(self, h, J, **parameters):
+        """Sample from an Ising model using the implemented sample method.
+
+        The model is constructed directly as a :class:`dimod.AdjVectorBQM`,
+        which can be serialized without further conversion.
+
+        Args:
+            h (dict/list):
+                Linear biases of the Ising problem. If a list, the list's
+                indices are used as variable labels.
+
+            J (dict[(variable, variable), bias]):
+                Quadratic biases of the Ising problem.
+
+            **parameters:
+                See :meth:`~dwave.system.samplers.LeapHybridSampler.sample`.
+
+        Returns:
+            :class:`dimod.SampleSet`: A `dimod` :obj:`~dimod.SampleSet` object.
+
+        """
+        bqm = dimod.AdjVectorBQM.from_ising(h, J)
+        return self.sample(bqm, **parameters)
+
+    def sample_qubo(self, Q, **parameters):
+        """Sample from a QUBO using the implemented sample method.
+
+        The model is constructed directly as a :class:`dimod.AdjVectorBQM`,
+        which can be serialized without further conversion.
+
+        Args:
+            Q (dict):
+                Coefficients of a quadratic unconstrained binary optimization
+                (QUBO) problem. Should be a dict of the form
+                `{(u, v): bias, ...}`.
+
+            **parameters:
+                See :meth:`~dwave.system.samplers.LeapHybridSampler.sample`.
+
+        Returns:
+            :class:`dimod.SampleSet`: A `dimod` :obj:`~dimod.SampleSet` object.
+
+        """
+        bqm = dimod.AdjVectorBQM.from_qubo(Q)
+        return self.sample(bqm, **parameters)
+
     def _sample(self, bqm, **kwargs):
         """Sample from the given BQM."""
         # get a FileView-compatibile BQM
-        bqm = dimod.as_bqm(bqm, cls=[dimod.AdjArrayBQM,
-                                     dimod.AdjMapBQM,
-                                     dimod.AdjVectorBQM])
+        if not isinstance(bqm, _FILEVIEW_BQM_TYPES):
+            bqm = dimod.AdjVectorBQM(bqm)
 
-        with FileView(bqm, version=2) as fv:
-            sapi_problem_id = self.solver.upload_bqm(fv).result()
+        sapi_problem_id = self._upload(bqm)
 
         return self.solver.sample_bqm(sapi_problem_id, **kwargs).sampleset
 
@@ -211,18 +418,39 @@ class LeapHybridSampler(dimod.Sampler):
         """
         # get a FileView-compatibile BQM
         # it is also important that the BQM be ordered
-        bqm = dimod.as_bqm(bqm, cls=[dimod.AdjArrayBQM,
-                                     dimod.AdjMapBQM,
-                                     dimod.AdjVectorBQM])
+        if not isinstance(bqm, _FILEVIEW_BQM_TYPES):
+            bqm = dimod.AdjVectorBQM(bqm)
 
-        with FileView(bqm, version=2, ignore_labels=True) as fv:
-            sapi_problem_id = self.solver.upload_bqm(fv).result()
+        sapi_problem_id = self._upload(bqm, ignore_labels=True)
 
         sampleset = self.solver.sample_bqm(sapi_problem_id, **kwargs).sampleset
 
-        # relabel, as of dimod 0.9.5+ this is not blocking
-        mapping = dict(enumerate(bqm.iter_variables()))
-        return sampleset.relabel_variables(mapping)
+        # the labels are already the indices, so there is nothing to relabel
+        if _is_range(bqm.variables):
+            return sampleset
+
+        # the returned variables are the indices of the BQM's variables, so
+        # rather than building a mapping and relabelling we build a new
+        # sampleset around the same record. Deferred so as to not block.
+        # The labels are read now, in case the BQM is modified before the
+        # sampleset is resolved. We use a list because bqm.variables is not
+        # indexable for all BQM types, e.g. it is a KeysView for the cython
+        # BQMs in dimod 0.9
+        labels = list(bqm.variables)
+
+        def relabel(ss):
+            return dimod.SampleSet(ss.record, list(map(labels.__getitem__, ss.variables)),
+                                   ss.info, ss.vartype)
+
+        return dimod.SampleSet.from_future(sampleset, relabel)
+
+    def _upload(self, bqm, ignore_labels=False):
+        """Upload the given FileView-compatible BQM, return the problem id."""
+        # the file view is handed to the cloud-client as-is; it seeks and
+        # reads one multipart-upload part at a time, so the serialized BQM is
+        # never materialized in full. Do not read it into a buffer here.
+        with FileView(bqm, version=2, ignore_labels=ignore_labels) as fv:
+            return self.solver.upload_bqm(fv).result()
 
     def min_time_limit(self, bqm):
         """Return the minimum `time_limit` accepted for the given problem.
@@ -244,8 +472,13 @@ class LeapHybridSampler(dimod.Sampler):
             variables).
         """
 
-        xx, yy = zip(*self.properties["minimum_time_limit"])
-        return np.interp([bqm.num_variables], xx, yy)[0]
+        # the curve is static for a given solver so unzip it only once
+        try:
+            xx, yy = self._min_time_limit_pivots
+        except AttributeError:
+            xx, yy = self._min_time_limit_pivots = _pivots(
+                self.properties['minimum_time_limit'])
+        return _interp(bqm.num_variables, xx, yy)
 
 LeapHybridBQMSampler = LeapHybridSampler
 
@@ -262,6 +495,11 @@ class LeapHybridDQMSampler:
     `D-Wave Cloud Client <https://docs.ocean.dwavesys.com/en/stable/docs_cloud/sdk_index.html>`_.
 
     Args:
+        connection_close (bool, optional, default=False):
+            Force HTTP connections to the solver API to be closed after each
+            request. By default, connections are kept alive and reused across
+            the upload, submit and poll requests of successive samples.
+
         **config:
             Keyword arguments passed to :meth:`dwave.cloud.client.Client.from_config`.
 
@@ -303,7 +541,7 @@ class LeapHybridDQMSampler:
 
     """
 
-    def __init__(self, solver=None, connection_close=True, **config):
+    def __init__(self, solver=None, connection_close=False, **config):
 
         # we want a Hybrid solver by default, but allow override
         config.setdefault('client', 'hybrid')
@@ -336,15 +574,20 @@ class LeapHybridDQMSampler:
 
     @property
     def properties(self):
-        """dict: Solver properties as returned by a SAPI query.
+        """Mapping: Solver properties as returned by a SAPI query.
 
         `Solver properties <https://docs.dwavesys.com/docs/latest/c_solver_3.html>`_
         are dependent on the selected solver and subject to change.
+
+        The properties are a read-only view of the solver's properties. The
+        view cannot be serialized directly (e.g., with :func:`json.dumps`,
+        :func:`copy.deepcopy` or :mod:`pickle`); use ``dict(properties)`` to
+        get a copy.
         """
         try:
             return self._properties
         except AttributeError:
-            self._properties = properties = self.solver.properties.copy()
+            self._properties = properties = MappingProxyType(self.solver.properties)
             return properties
 
     @property
@@ -417,12 +660,6 @@ class LeapHybridDQMSampler:
                                     self.properties['maximum_time_limit_hrs'],
                                     time_limit))
 
-        # we convert to a file here rather than let the cloud-client handle
-        # it because we want to strip the labels and let the user handle
-        # note: SpooledTemporaryFile currently returned by DQM.to_file
-        # does not implement io.BaseIO interface, so we use the underlying
-        # (and internal) file-like object for now
-
         if compressed is not None:
             warn(
                 "Argument 'compressed' is deprecated and in future will raise an "
@@ -431,9 +668,44 @@ class LeapHybridDQMSampler:
                 )
             compress = compressed or compress
 
+        # we convert to a file here rather than let the cloud-client handle
+        # it because we want to strip the labels and let the user handle
+        # note: SpooledTemporaryFile currently returned by DQM.to_file
+        # does not implement io.BaseIO interface, so we use the underlying
+        # (and internal) file-like object for now. Below the spool size
+        # that object is an io.BytesIO, so small DQMs are serialized
+        # in memory without touching the disk.
         f = dqm.to_file(compress=compress, ignore_labels=True)._file
         sampleset = self.solver.sample_dqm(f, time_limit=time_limit, **kwargs).sampleset
-        return sampleset.relabel_variables(dict(enumerate(dqm.variables)))
+
+        # the labels are already the indices, so there is nothing to relabel
+        if _is_range(dqm.variables):
+            return sampleset
+
+        return sampleset.relabel_variables(dict(zip(range(dqm.num_variables()),
+                                                    dqm.variables)))
+
+    async def sample_dqm_async(self, dqm, time_limit=None, compress=False,
+                               compressed=None, **kwargs):
+        """Sample from the specified discrete quadratic model asynchronously.
+
+        Coroutine version of
+        :meth:`~dwave.system.samplers.LeapHybridDQMSampler.sample_dqm`.
+        Uploading the problem and waiting on the solver are done in the event
+        loop's default executor, so several problems can be in flight at once
+        and the returned sample set is already resolved.
+        Accepts the same arguments as
+        :meth:`~dwave.system.samplers.LeapHybridDQMSampler.sample_dqm`.
+
+        Returns:
+            :class:`dimod.SampleSet`: A sample set.
+
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(_sample_resolved, self.sample_dqm, dqm,
+                                    time_limit=time_limit, compress=compress,
+                                    compressed=compressed, **kwargs))
 
     def min_time_limit(self, dqm):
         """Return the minimum `time_limit` accepted for the given problem.
@@ -459,6 +731,10 @@ class LeapHybridDQMSampler:
         """
         ec = (dqm.num_variable_interactions() * dqm.num_cases() /
               max(dqm.num_variables(), 1))
-        limits = np.array(self.properties['minimum_time_limit'])
-        t = np.interp(ec, limits[:, 0], limits[:, 1])
-        return max([5, t])
+        # the curve is static for a given solver so unzip it only once
+        try:
+            xx, yy = self._min_time_limit_pivots
+        except AttributeError:
+            xx, yy = self._min_time_limit_pivots = _pivots(
+                self.properties['minimum_time_limit'])
+        return max(5., _interp(ec, xx, yy))
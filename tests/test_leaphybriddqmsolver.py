@@ -12,13 +12,17 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
+import types
 import unittest
 
 from unittest.mock import patch
 
 import dimod
+import numpy as np
 
 from dwave.system import LeapHybridDQMSampler
+from dwave.system.samplers.leap_hybrid_sampler import _interp, _pivots
 
 
 class TestLeapHybridDQMSampler(unittest.TestCase):
@@ -60,3 +64,67 @@ class TestLeapHybridDQMSampler(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             sampler.sample_dqm(dqm, time_limit=10000000)
+
+        loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(ValueError):
+                loop.run_until_complete(sampler.sample_dqm_async(dqm, time_limit=1))
+        finally:
+            loop.close()
+
+    def test_relabel(self):
+
+        class MockSolver():
+            properties = dict(category='hybrid',
+                              minimum_time_limit=[[20000, 5.0],
+                                                  [100000, 6.0]],
+                              )
+            supported_problem_types = ['dqm']
+
+            def sample_dqm(self, *args, **kwargs):
+                sampleset = dimod.SampleSet.from_samples(
+                    ([[0, 1]], [0, 1]), dimod.BINARY, 0)
+                return types.SimpleNamespace(sampleset=sampleset)
+
+        class MockClient():
+            @classmethod
+            def from_config(cls, *args, **kwargs):
+                return cls()
+
+            def get_solver(self, *args, **kwargs):
+                return MockSolver()
+
+        with patch('dwave.system.samplers.leap_hybrid_sampler.Client', MockClient):
+            sampler = LeapHybridDQMSampler()
+
+        dqm = dimod.DQM()
+        dqm.add_variable(2, label='a')
+        dqm.add_variable(2, label='b')
+
+        sampleset = sampler.sample_dqm(dqm)
+        self.assertEqual(list(sampleset.variables), ['a', 'b'])
+        self.assertEqual(sampleset.first.sample, {'a': 0, 'b': 1})
+
+        dqm = dimod.DQM()
+        dqm.add_variable(2)
+        dqm.add_variable(2)
+
+        sampleset = sampler.sample_dqm(dqm)
+        self.assertEqual(list(sampleset.variables), [0, 1])
+        self.assertEqual(sampleset.first.sample, {0: 0, 1: 1})
+
+
+class TestInterp(unittest.TestCase):
+    def test_matches_numpy(self):
+        xp = [20000, 100000, 200000, 500000, 1000000, 250000000]
+        fp = [5.0, 6.0, 13.0, 34.0, 71.0, 1200.0]
+
+        for x in [0, 20000, 20001, 99999.5, 100000, 123456, 999999,
+                  1000000, 250000000, 300000000]:
+            self.assertAlmostEqual(_interp(x, xp, fp), np.interp(x, xp, fp))
+
+
+class TestPivots(unittest.TestCase):
+    def test_pivots(self):
+        self.assertEqual(_pivots([[1, 0.1], [100, 10], [1000, 20.0]]),
+                         ((1., 100., 1000.), (.1, 10., 20.)))
@@ -13,6 +13,9 @@
 #    limitations under the License.
 #
 # =============================================================================
+import asyncio
+import threading
+import types
 import unittest
 import numpy as np
 
@@ -28,6 +31,7 @@ except ImportError:
     import mock
 
 from dwave.system.samplers import LeapHybridSampler
+from dwave.system.samplers.leap_hybrid_sampler import _is_range
 from dwave.system.testing import MockLeapHybridSolver
 
 # Called only for named solver
@@ -62,7 +66,7 @@ class TestLeapHybridSampler(unittest.TestCase):
         mock_client.reset_mock()
         LeapHybridSampler()
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=True,
+            client='hybrid', connection_close=False,
             solver={'category': 'hybrid',
                     'supported_problem_types__contains': 'bqm',
                     'order_by': '-version'})
@@ -77,7 +81,7 @@ class TestLeapHybridSampler(unittest.TestCase):
         LeapHybridSampler(solver={'category': 'hybrid',
                                   'supported_problem_types__contains': 'bqm'})
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=True,
+            client='hybrid', connection_close=False,
             solver={'category': 'hybrid',
                     'supported_problem_types__contains': 'bqm',
                     'order_by': '-version'})
@@ -90,7 +94,7 @@ class TestLeapHybridSampler(unittest.TestCase):
         mock_client.reset_mock()
         LeapHybridSampler(solver={'qpu': True})
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=True,
+            client='hybrid', connection_close=False,
             solver={'qpu': True, 'category': 'hybrid',
                     'supported_problem_types__contains': 'bqm',
                     'order_by': '-version'})
@@ -98,7 +102,7 @@ class TestLeapHybridSampler(unittest.TestCase):
         mock_client.reset_mock()
         LeapHybridSampler(solver={'qpu': True, 'anneal_schedule': False})
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=True,
+            client='hybrid', connection_close=False,
             solver={'anneal_schedule': False, 'qpu': True, 'category': 'hybrid',
                     'supported_problem_types__contains': 'bqm',
                     'order_by': '-version'})
@@ -107,32 +111,32 @@ class TestLeapHybridSampler(unittest.TestCase):
         mock_client.reset_mock()
         LeapHybridSampler(solver="hybrid_solver")
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=True, solver="hybrid_solver")
+            client='hybrid', connection_close=False, solver="hybrid_solver")
 
         mock_client.reset_mock()
-        LeapHybridSampler(connection_close=False, solver="hybrid_solver")
+        LeapHybridSampler(connection_close=True, solver="hybrid_solver")
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=False, solver="hybrid_solver")
+            client='hybrid', connection_close=True, solver="hybrid_solver")
 
         # Named solver: non-hybrid
         with self.assertRaises(ValueError):
             LeapHybridSampler(solver="not_hybrid_solver")
 
-        # Set connection_close to False
+        # Set connection_close to True
         mock_client.reset_mock()
-        LeapHybridSampler(connection_close=False)
+        LeapHybridSampler(connection_close=True)
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=False,
+            client='hybrid', connection_close=True,
             solver={'category': 'hybrid',
                     'supported_problem_types__contains': 'bqm',
                     'order_by': '-version'})
 
         mock_client.reset_mock()
-        LeapHybridSampler(connection_close=False,
+        LeapHybridSampler(connection_close=True,
                           solver={'category': 'hybrid',
                                   'supported_problem_types__contains': 'bqm'})
         mock_client.from_config.assert_called_once_with(
-            client='hybrid', connection_close=False,
+            client='hybrid', connection_close=True,
             solver={'category': 'hybrid',
                     'supported_problem_types__contains': 'bqm',
                     'order_by': '-version'})
@@ -196,3 +200,227 @@ class TestLeapHybridSampler(unittest.TestCase):
         self.assertEqual(cols, 2)
         self.assertTrue(np.all(response.record.sample >= 0))
         self.assertIs(response.vartype, dimod.BINARY)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_qubo_ising_bqm_type(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        with mock.patch.object(LeapHybridSampler, 'sample') as mock_sample:
+            sampler.sample_qubo({(0, 0): -1, (0, 1): 1}, time_limit=5)
+            bqm, = mock_sample.call_args[0]
+            self.assertIsInstance(bqm, dimod.AdjVectorBQM)
+            self.assertIs(bqm.vartype, dimod.BINARY)
+            self.assertEqual(mock_sample.call_args[1], {'time_limit': 5})
+
+            sampler.sample_ising({0: -1}, {(0, 1): 1})
+            bqm, = mock_sample.call_args[0]
+            self.assertIsInstance(bqm, dimod.AdjVectorBQM)
+            self.assertIs(bqm.vartype, dimod.SPIN)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_min_time_limit(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqm = dimod.BQM.from_qubo({(v, v): 1 for v in range(2560)})
+        self.assertAlmostEqual(sampler.min_time_limit(bqm), 5.5)
+
+        # the curve is clamped at both ends
+        bqm = dimod.BQM.from_qubo({(v, v): 1 for v in range(20000)})
+        self.assertAlmostEqual(sampler.min_time_limit(bqm), 40.)
+        self.assertAlmostEqual(sampler.min_time_limit(dimod.BQM.empty('SPIN')), 1.)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_async(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqm0 = dimod.BQM.from_ising({'a': -1}, {'ab': 1})
+        bqm1 = dimod.BQM.from_qubo({(0, 1): -1})
+
+        async def sample_both():
+            return await asyncio.gather(sampler.sample_async(bqm0),
+                                        sampler.sample_async(bqm1))
+
+        resolved_in = []
+        resolve = dimod.SampleSet.resolve
+
+        def record_resolve(sampleset):
+            resolved_in.append(threading.current_thread())
+            return resolve(sampleset)
+
+        loop = asyncio.new_event_loop()
+        try:
+            with mock.patch.object(dimod.SampleSet, 'resolve', record_resolve):
+                ss0, ss1 = loop.run_until_complete(sample_both())
+
+            with self.assertRaises(ValueError):
+                loop.run_until_complete(sampler.sample_async(bqm0, time_limit=-1))
+        finally:
+            loop.close()
+
+        # the sample sets are resolved in the executor, not the event loop
+        self.assertGreaterEqual(len(resolved_in), 2)
+        self.assertNotIn(threading.main_thread(), resolved_in)
+
+        self.assertEqual(set(ss0.variables), {'a', 'b'})
+        self.assertIs(ss0.vartype, dimod.SPIN)
+        self.assertEqual(set(ss1.variables), {0, 1})
+        self.assertIs(ss1.vartype, dimod.BINARY)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_fileview_bqm_not_copied(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqm = dimod.AdjVectorBQM.from_ising({'a': -1}, {'ab': 1})
+
+        with mock.patch.object(LeapHybridSampler, '_upload',
+                               side_effect=sampler._upload) as mock_upload:
+            sampler.sample(bqm)
+            self.assertIs(mock_upload.call_args[0][0], bqm)
+
+            sampler.sample(dimod.BinaryQuadraticModel(bqm))
+            self.assertIsInstance(mock_upload.call_args[0][0], dimod.AdjVectorBQM)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_large_labels(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqm = dimod.AdjVectorBQM.from_ising({'a': -1, 'b': 1}, {'ab': 1, 'bc': -1})
+
+        # force the unlabelled path
+        with mock.patch.object(LeapHybridSampler, '_INTEGER_BQM_SIZE_THRESHOLD', 1):
+            sampleset = sampler.sample(bqm)
+
+        self.assertEqual(list(sampleset.variables), ['a', 'b', 'c'])
+        self.assertIs(sampleset.vartype, dimod.SPIN)
+        for sample, energy in sampleset.data(['sample', 'energy']):
+            self.assertAlmostEqual(bqm.energy(sample), energy)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_large_labels_bqm_modified(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqm = dimod.AdjVectorBQM.from_ising({'a': -1, 'b': 1}, {'ab': 1, 'bc': -1})
+
+        with mock.patch.object(LeapHybridSampler, '_INTEGER_BQM_SIZE_THRESHOLD', 1):
+            sampleset = sampler.sample(bqm)
+
+        # modify the BQM before the sampleset is resolved
+        bqm.relabel_variables({'a': 'x', 'b': 'y', 'c': 'z'})
+        bqm.add_variable('w', 1)
+
+        self.assertEqual(list(sampleset.variables), ['a', 'b', 'c'])
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_properties_read_only(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        self.assertEqual(sampler.properties['category'], 'hybrid')
+        with self.assertRaises(TypeError):
+            sampler.properties['category'] = 'qpu'
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_many(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqms = [dimod.BQM.from_ising({v: -1}, {}) for v in 'abcde']
+
+        samplesets = sampler.sample_many(iter(bqms), max_in_flight=2)
+
+        self.assertEqual(len(samplesets), len(bqms))
+        for bqm, sampleset in zip(bqms, samplesets):
+            self.assertEqual(list(sampleset.variables), list(bqm.variables))
+
+        self.assertEqual(sampler.sample_many([]), [])
+
+        with self.assertRaises(ValueError):
+            sampler.sample_many(bqms, max_in_flight=0)
+
+        with self.assertRaises(ValueError):
+            sampler.sample_many(bqms, time_limit=-1)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_many_error(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        bqms = [dimod.BQM.from_ising({v: -1}, {}) for v in 'abcde']
+
+        def sample(bqm, **kwargs):
+            if bqm is bqms[1]:
+                raise ValueError
+            return dimod.SampleSet.from_samples_bqm({v: 1 for v in bqm.variables}, bqm)
+
+        with mock.patch.object(LeapHybridSampler, 'sample', side_effect=sample) as mock_sample:
+            with self.assertRaises(ValueError):
+                sampler.sample_many(iter(bqms), max_in_flight=1)
+
+        # the problems after the failing one were never sampled
+        self.assertEqual([c[0][0] for c in mock_sample.call_args_list], bqms[:2])
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_sample_large_index_labels(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        sampler = LeapHybridSampler()
+
+        # the solver's sampleset is labelled by variable index
+        solver_sampleset = dimod.SampleSet.from_samples(
+            ([[0, 1, 1]], [0, 1, 2]), dimod.BINARY, 0)
+        future = types.SimpleNamespace(sampleset=solver_sampleset)
+
+        with mock.patch.object(LeapHybridSampler, '_INTEGER_BQM_SIZE_THRESHOLD', 1), \
+                mock.patch.object(MockLeapHybridSolver, 'sample_bqm', return_value=future):
+
+            # labels are the indices, the sampleset is returned unchanged
+            bqm = dimod.AdjVectorBQM.from_qubo({(0, 1): -1, (1, 2): 1})
+            sampleset = sampler.sample(bqm)
+
+            self.assertIs(sampleset, solver_sampleset)
+
+            # integer labels out of order still need relabelling
+            bqm = dimod.AdjVectorBQM.from_qubo({(1, 1): 1, (0, 0): 1, (2, 2): 1})
+            self.assertEqual(list(bqm.variables), [1, 0, 2])
+            sampleset = sampler.sample(bqm)
+
+            self.assertIsNot(sampleset, solver_sampleset)
+            self.assertEqual(list(sampleset.variables), [1, 0, 2])
+            self.assertEqual(sampleset.first.sample, {1: 0, 0: 1, 2: 1})
+
+
+class TestIsRange(unittest.TestCase):
+    def test_is_range(self):
+        self.assertTrue(_is_range([]))
+        self.assertTrue(_is_range(range(5)))
+        self.assertTrue(_is_range(dimod.AdjVectorBQM.from_qubo({(0, 1): 1}).variables))
+        self.assertFalse(_is_range([1, 0]))
+        self.assertFalse(_is_range([0, 2]))
+        self.assertFalse(_is_range(['a', 'b']))
+        self.assertFalse(_is_range([0, 1.0]))
+        self.assertFalse(_is_range([False, True]))